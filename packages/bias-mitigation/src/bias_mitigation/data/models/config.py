@@ -9,6 +9,11 @@ from pydantic_settings import (
 )
 from returns.result import safe
 
+try:  # libyaml-backed safe loader when available; pure-Python SafeLoader otherwise
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
 
 class BBQConfig(BaseModel):
     """Configuration for BBQ dataset."""
@@ -65,7 +70,7 @@ class AppConfig(BaseSettings):
     def from_yaml(cls, path: Path) -> 'AppConfig':
         """Static Factory method mapping raw YAML safely to domain config schemas."""
         with path.open(encoding='utf-8') as f:
-            raw = yaml.safe_load(f) or {}
+            raw = yaml.load(f, Loader=YamlLoader) or {}
         return cls(**raw)
 
 
@@ -1,20 +1,21 @@
 import asyncio
-import json
 import os
-from collections.abc import Sequence
+from collections.abc import Awaitable, Sequence
 from itertools import batched
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Literal, TypedDict, cast
 
 import click
 import dotenv
+import orjson
 from loguru import logger
 from returns.future import future_safe
 from returns.io import IOFailure, IOResult, IOSuccess
 from returns.iterables import Fold
 from returns.result import Failure, Result, Success, safe
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
-from sqlmodel import SQLModel
+from sqlmodel import SQLModel, col
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from bias_mitigation.data.errors import DomainError, ParsingError
@@ -29,20 +30,68 @@ from bias_mitigation.data.schemas import (
 
 dotenv.load_dotenv()
 
+# Parsed rows stay plain dicts: they feed core bulk INSERTs directly, so building per-row
+# SQLModel instances (ORM instrumentation on every attribute) would be pure overhead.
+# Keys mirror the table columns; nested lists hold the child rows of each relationship.
 
-@safe(exceptions=(json.JSONDecodeError, KeyError, IndexError, ValueError, TypeError))
-def parse_bbq_line(raw_line: str, category: str) -> BBQ:
-    """Pure parser: JSONL line -> BBQ model."""
-    data = json.loads(raw_line)
+
+class BBQAnswerRow(TypedDict):
+    index: int
+    text: str
+    tag: str
+
+
+class BBQRow(TypedDict):
+    example_id: int
+    question_index: str
+    question_polarity: str
+    context_condition: str
+    category: str
+    subcategory: str
+    stereotyped_groups: list[str]
+    additional_metadata: dict[str, Any]
+    context: str
+    question: str
+    ans0: str
+    ans1: str
+    ans2: str
+    label: int
+    answers: list[BBQAnswerRow]
+
+
+class LabelRow(TypedDict):
+    label: str
+    human_id: str
+
+
+class SentenceRow(TypedDict):
+    sentence: str
+    sentence_id: str
+    gold_label: str
+    labels: list[LabelRow]
+
+
+class StereoSetRow(TypedDict):
+    id: str
+    target: str
+    bias_type: str
+    context: str
+    type: str
+    sentences: list[SentenceRow]
+
+
+@safe(exceptions=(orjson.JSONDecodeError, KeyError, IndexError, ValueError, TypeError))
+def parse_bbq_line(raw_line: bytes, category: str) -> BBQRow:
+    """Pure parser: JSONL line -> BBQ row dict with nested `answers` rows."""
+    data = orjson.loads(raw_line)
 
     # Build answers list from answer_info (id auto-generated by database)
-    answers = [
-        BBQAnswer(
-            id=None,
-            index=i,
-            text=data[f'ans{i}'],
-            tag=data['answer_info'][f'ans{i}'][1],  # second item is tag
-        )
+    answers: list[BBQAnswerRow] = [
+        {
+            'index': i,
+            'text': data[f'ans{i}'],
+            'tag': data['answer_info'][f'ans{i}'][1],  # second item is tag
+        }
         for i in range(3)
     ]
 
@@ -51,105 +100,164 @@ def parse_bbq_line(raw_line: str, category: str) -> BBQ:
     subcategory = additional_metadata.pop('subcategory', '')
     stereotyped_groups = additional_metadata.pop('stereotyped_groups', [])
 
-    return BBQ(
-        example_id=data['example_id'],
-        question_index=data['question_index'],
-        question_polarity=data['question_polarity'],
-        context_condition=data['context_condition'],
-        category=category,
-        subcategory=subcategory,
-        stereotyped_groups=stereotyped_groups,
-        additional_metadata=additional_metadata,
-        context=data['context'],
-        question=data['question'],
-        ans0=data['ans0'],
-        ans1=data['ans1'],
-        ans2=data['ans2'],
-        label=data['label'],
-        answers=answers,
-    )
-
-
-@safe(exceptions=(json.JSONDecodeError, KeyError, IndexError, ValueError, TypeError))
-def parse_stereoset_line(entry_dict: dict[str, Any], entry_type: str) -> StereoSet:
-    """Pure parser: dict -> StereoSet model."""
-    sentences = [
-        StereoSetSentence(
-            sentence=s['sentence'],
-            sentence_id=s['id'],
-            gold_label=s['gold_label'],
-            labels=[
-                StereoSetLabel(label=lbl['label'], human_id=lbl['human_id']) for lbl in s['labels']
-            ],
-        )
+    return {
+        'example_id': data['example_id'],
+        'question_index': data['question_index'],
+        'question_polarity': data['question_polarity'],
+        'context_condition': data['context_condition'],
+        'category': category,
+        'subcategory': subcategory,
+        'stereotyped_groups': stereotyped_groups,
+        'additional_metadata': additional_metadata,
+        'context': data['context'],
+        'question': data['question'],
+        'ans0': data['ans0'],
+        'ans1': data['ans1'],
+        'ans2': data['ans2'],
+        'label': data['label'],
+        'answers': answers,
+    }
+
+
+@safe(exceptions=(KeyError, IndexError, ValueError, TypeError))
+def parse_stereoset_line(entry_dict: dict[str, Any], entry_type: str) -> StereoSetRow:
+    """Pure parser: dict -> StereoSet row dict with nested `sentences` -> `labels` rows."""
+    sentences: list[SentenceRow] = [
+        {
+            'sentence': s['sentence'],
+            'sentence_id': s['id'],
+            'gold_label': s['gold_label'],
+            'labels': [{'label': lbl['label'], 'human_id': lbl['human_id']} for lbl in s['labels']],
+        }
         for s in entry_dict['sentences']
     ]
 
-    return StereoSet(
-        id=entry_dict['id'],
-        target=entry_dict['target'],
-        bias_type=entry_dict['bias_type'],
-        context=entry_dict['context'],
-        type=entry_type,
-        sentences=sentences,
-    )
+    return {
+        'id': entry_dict['id'],
+        'target': entry_dict['target'],
+        'bias_type': entry_dict['bias_type'],
+        'context': entry_dict['context'],
+        'type': entry_type,
+        'sentences': sentences,
+    }
+
+
+def _columns(
+    row: BBQRow | SentenceRow | StereoSetRow,
+    relationship: Literal['answers', 'labels', 'sentences'],
+) -> dict[str, Any]:
+    """Strip the nested child rows so only table columns are passed to INSERT."""
+    return {key: value for key, value in row.items() if key != relationship}
 
 
 @safe(exceptions=(FileNotFoundError, IOError, OSError))
-def read_lines(file_path: Path) -> list[str]:
-    """Pure I/O: read JSONL file, strip newlines."""
-    with file_path.open('r', encoding='utf-8') as f:
-        return [line.rstrip('\n') for line in f]
+def read_lines(file_path: Path) -> list[bytes]:
+    """Pure I/O: read JSONL file as raw byte lines (orjson parses bytes directly)."""
+    return file_path.read_bytes().splitlines()
 
 
-@safe(exceptions=(FileNotFoundError, IOError, OSError, json.JSONDecodeError))
+@safe(exceptions=(FileNotFoundError, IOError, OSError, orjson.JSONDecodeError))
 def read_json_file(file_path: Path) -> dict[str, Any]:
     """Pure I/O: read JSON file."""
-    with file_path.open('r', encoding='utf-8') as f:
-        return cast(dict[str, Any], json.load(f))
+    return cast(dict[str, Any], orjson.loads(file_path.read_bytes()))
 
 
-def parse_bbq_file(file_path: Path, category: str) -> Result[list[BBQ], DomainError]:
+def parse_bbq_file(file_path: Path, category: str) -> Result[list[BBQRow], DomainError]:
     """Declarative file parser: read -> parse each line."""
 
     def parse_all_lines(
-        lines: list[str],
-    ) -> Result[list[BBQ], DomainError]:
+        lines: list[bytes],
+    ) -> Result[list[BBQRow], DomainError]:
         """Parse all lines using pattern matching for fail-fast."""
         results = [parse_bbq_line(line, category) for line in lines]
 
         # Mypy needs explicit casting here for Fold.collect inner map.
-        folded = cast(Result[tuple[BBQ, ...], Exception], Fold.collect(results, Success(())))
+        folded = cast(Result[tuple[BBQRow, ...], Exception], Fold.collect(results, Success(())))
         return folded.map(list).alt(lambda e: ParsingError(message=f'Failed to parse BBQ {category}', cause=e, file_path=str(file_path)))
 
     return read_lines(file_path).alt(lambda e: cast(DomainError, ParsingError(message=f'Failed reading BBQ {category}', cause=e, file_path=str(file_path)))).bind(parse_all_lines)
 
 
-def parse_stereoset_file(file_path: Path, entry_type: str) -> Result[list[StereoSet], DomainError]:
+def parse_stereoset_file(
+    file_path: Path, entry_type: str
+) -> Result[list[StereoSetRow], DomainError]:
     """Declarative file parser for StereoSet."""
 
     def extract_and_parse(
         raw: dict[str, Any],
-    ) -> Result[list[StereoSet], DomainError]:
+    ) -> Result[list[StereoSetRow], DomainError]:
         """Extract entries from JSON structure and parse each."""
         raw_data: Any = raw.get('data', raw)
         raw_data = raw_data.get(entry_type) or raw_data.get(entry_type.capitalize()) or raw_data
 
         results = [parse_stereoset_line(entry, entry_type) for entry in raw_data]
-        folded = cast(Result[tuple[StereoSet, ...], Exception], Fold.collect(results, Success(())))
+        folded = cast(Result[tuple[StereoSetRow, ...], Exception], Fold.collect(results, Success(())))
         return folded.map(list).alt(lambda e: ParsingError(message=f'Failed to parse StereoSet {entry_type}', cause=e, file_path=str(file_path)))
     return read_json_file(file_path).alt(lambda e: cast(DomainError, ParsingError(message=f'Failed reading StereoSet {entry_type}', cause=e, file_path=str(file_path)))).bind(extract_and_parse)
 
 
 @future_safe
-async def insert_batch_async(
+async def insert_bbq_batch_async(
+    session_factory: async_sessionmaker[AsyncSession],
+    batch: Sequence[BBQRow],
+) -> int:
+    """Bulk insert a batch of BBQ rows and their answers within an isolated transaction.
+
+    Uses core executemany INSERTs instead of ORM unit-of-work flushes; parent ids come back
+    via RETURNING in parameter order and are attached to the child rows.
+    """
+    async with session_factory() as session, session.begin():
+        result = await session.exec(
+            insert(BBQ).returning(col(BBQ.id), sort_by_parameter_order=True),
+            params=[_columns(bbq, 'answers') for bbq in batch],
+        )
+        bbq_ids = [bbq_id for (bbq_id,) in result]
+
+        answer_rows = [
+            {**answer, 'bbq_id': bbq_id}
+            for bbq, bbq_id in zip(batch, bbq_ids, strict=True)
+            for answer in bbq['answers']
+        ]
+        if answer_rows:
+            await session.exec(insert(BBQAnswer), params=answer_rows)
+    return len(batch)
+
+
+@future_safe
+async def insert_stereoset_batch_async(
     session_factory: async_sessionmaker[AsyncSession],
-    batch: Sequence[SQLModel],
+    batch: Sequence[StereoSetRow],
 ) -> int:
-    """Insert single batch of models within an isolated transaction."""
+    """Bulk insert StereoSet entries -> sentences -> labels within an isolated transaction."""
     async with session_factory() as session, session.begin():
-        for model in batch:
-            session.add(model)
+        await session.exec(
+            insert(StereoSet), params=[_columns(entry, 'sentences') for entry in batch]
+        )
+
+        sentences = [sentence for entry in batch for sentence in entry['sentences']]
+        sentence_rows = [
+            _columns(sentence, 'labels') | {'stereoset_id': entry['id']}
+            for entry in batch
+            for sentence in entry['sentences']
+        ]
+        # An empty executemany would render `INSERT ... DEFAULT VALUES` and fail NOT NULL
+        sentence_ids: list[int | None] = []
+        if sentence_rows:
+            result = await session.exec(
+                insert(StereoSetSentence).returning(
+                    col(StereoSetSentence.id), sort_by_parameter_order=True
+                ),
+                params=sentence_rows,
+            )
+            sentence_ids = [sentence_id for (sentence_id,) in result]
+
+        label_rows = [
+            {**label, 'sentence_id': sentence_id}
+            for sentence, sentence_id in zip(sentences, sentence_ids, strict=True)
+            for label in sentence['labels']
+        ]
+        if label_rows:
+            await session.exec(insert(StereoSetLabel), params=label_rows)
     return len(batch)
 
 
@@ -168,9 +276,10 @@ async def process_bbq_category(
     session_factory: async_sessionmaker[AsyncSession],
     file_path: Path,
     category: str,
+    parsing: Awaitable[Result[list[BBQRow], DomainError]],
 ) -> Result[int, DomainError]:
-    """Process single BBQ category: parse file -> insert all -> return count."""
-    parse_result = parse_bbq_file(file_path, category)
+    """Process single BBQ category: await its running parse -> insert all -> return count."""
+    parse_result = await parsing
 
     match parse_result:
         case Success(entries):
@@ -178,7 +287,7 @@ async def process_bbq_category(
             batches = list(batched(entries, chunk_size))
             # Insert sequentially because SQLite locks the whole DB for concurrent writes
             insert_results = [
-                await insert_batch_async(session_factory, batch).awaitable() for batch in batches
+                await insert_bbq_batch_async(session_factory, batch).awaitable() for batch in batches
             ]
             total = sum(map(_get_result, insert_results))
             logger.info(f'Loaded {total} BBQ entries for {category}')
@@ -194,16 +303,18 @@ async def process_stereoset_category(
     session_factory: async_sessionmaker[AsyncSession],
     file_path: Path,
     entry_type: str,
+    parsing: Awaitable[Result[list[StereoSetRow], DomainError]],
 ) -> Result[int, DomainError]:
-    """Process single StereoSet file: parse -> insert -> return count."""
-    parse_result = parse_stereoset_file(file_path, entry_type)
+    """Process single StereoSet file: await its running parse -> insert -> return count."""
+    parse_result = await parsing
 
     match parse_result:
         case Success(entries):
             chunk_size = 1000
             batches = list(batched(entries, chunk_size))
             insert_results = [
-                await insert_batch_async(session_factory, batch).awaitable() for batch in batches
+                await insert_stereoset_batch_async(session_factory, batch).awaitable()
+                for batch in batches
             ]
             total = sum(map(_get_result, insert_results))
             logger.info(f'Loaded {total} StereoSet entries from {entry_type}')
@@ -263,10 +374,6 @@ async def orchestrate_full_ingestion(
         if target[1].exists() or logger.warning(f'Skipping missing BBQ file: {target[1]}')
     ]
 
-    bbq_results = [
-        process_bbq_category(session_factory, path, cat) for cat, path in valid_bbq_targets
-    ]
-
     # Process StereoSet files mapping lazily
     stereoset_files = list(cfg.stereoset.files.keys())
 
@@ -278,18 +385,31 @@ async def orchestrate_full_ingestion(
         if target[1].exists() or logger.warning(f'Skipping missing StereoSet file: {target[1]}')
     ]
 
-    ss_results = [
-        process_stereoset_category(session_factory, path, entry_type)
+    # Every file starts parsing on a worker thread up front, but inserts run one file at a time
+    # in config order so the generated BBQ/StereoSet ids are identical from run to run
+    bbq_parsing = [
+        asyncio.create_task(asyncio.to_thread(parse_bbq_file, path, cat))
+        for cat, path in valid_bbq_targets
+    ]
+    ss_parsing = [
+        asyncio.create_task(asyncio.to_thread(parse_stereoset_file, path, entry_type))
         for entry_type, path in valid_ss_targets
     ]
 
-    all_awaitables = bbq_results + ss_results
+    bbq_results = [
+        await process_bbq_category(session_factory, path, cat, parsing)
+        for (cat, path), parsing in zip(valid_bbq_targets, bbq_parsing, strict=True)
+    ]
+    ss_results = [
+        await process_stereoset_category(session_factory, path, entry_type, parsing)
+        for (entry_type, path), parsing in zip(valid_ss_targets, ss_parsing, strict=True)
+    ]
+
+    all_results = bbq_results + ss_results
     category_labels = [cat for cat, _ in valid_bbq_targets] + [
         entry_type for entry_type, _ in valid_ss_targets
     ]
 
-    all_results = [await awaitable for awaitable in all_awaitables]
-
     # Declarative aggregation replacing imperative loops using Fold.collect
     # 1. We optionally map Failure to Success(0) if we want identical fallback to the imperative version that swallowed to 0.
     # Let's map Failure -> Success(0) locally per item to respect the original mapping intent, then Fold.
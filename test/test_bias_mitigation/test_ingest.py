@@ -0,0 +1,164 @@
+import json
+
+import pytest
+from returns.io import IOSuccess
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from bias_mitigation.data.schemas import BBQ, StereoSet, StereoSetSentence
+from scripts.ingest_datasets import (
+    insert_bbq_batch_async,
+    insert_stereoset_batch_async,
+    parse_bbq_line,
+    parse_stereoset_line,
+)
+
+
+def bbq_line(example_id):
+    """
+    Build a raw BBQ JSONL line whose answers are unique per example.
+    """
+    return json.dumps({
+        "example_id": example_id,
+        "question_index": "1",
+        "question_polarity": "neg",
+        "context_condition": "ambig",
+        "category": "Age",
+        "answer_info": {
+            "ans0": [f"old-{example_id}", "old"],
+            "ans1": [f"young-{example_id}", "nonOld"],
+            "ans2": ["Unknown", "unknown"],
+        },
+        "additional_metadata": {
+            "subcategory": "None",
+            "stereotyped_groups": ["old"],
+            "version": "a",
+            "source": "test",
+        },
+        "context": f"Context {example_id}",
+        "question": "Who forgot?",
+        "ans0": f"old-{example_id}",
+        "ans1": f"young-{example_id}",
+        "ans2": "Unknown",
+        "label": 2,
+    }).encode()
+
+
+def stereoset_entry(entry_id, sentence_count, label_count):
+    """
+    Build a raw StereoSet entry with tagged sentence and annotator ids.
+    """
+    return {
+        "id": entry_id,
+        "target": "target",
+        "bias_type": "gender",
+        "context": f"Context {entry_id}",
+        "sentences": [
+            {
+                "sentence": f"{entry_id} sentence {i}",
+                "id": f"{entry_id}-s{i}",
+                "gold_label": "stereotype",
+                "labels": [
+                    {"label": "stereotype", "human_id": f"{entry_id}-s{i}-h{j}"}
+                    for j in range(label_count)
+                ],
+            }
+            for i in range(sentence_count)
+        ],
+    }
+
+
+@pytest.fixture
+async def session_factory():
+    """
+    In-memory SQLite database with the ingest schema created.
+    """
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    await engine.dispose()
+
+
+async def test_bbq_answers_point_at_their_parent(session_factory):
+    """
+    Bulk-inserted answers must be wired to the BBQ row they were parsed with.
+    """
+    rows = [parse_bbq_line(bbq_line(example_id), "Age").unwrap() for example_id in (10, 11, 12)]
+
+    result = await insert_bbq_batch_async(session_factory, rows).awaitable()
+    assert result == IOSuccess(3)
+
+    async with session_factory() as session:
+        entries = (await session.exec(select(BBQ).options(selectinload(BBQ.answers)))).all()
+
+    assert sorted(bbq.example_id for bbq in entries) == [10, 11, 12]
+    for bbq in entries:
+        answers = sorted(bbq.answers, key=lambda answer: answer.index)
+        assert [answer.text for answer in answers] == [bbq.ans0, bbq.ans1, bbq.ans2]
+        assert all(answer.bbq_id == bbq.id for answer in answers)
+
+
+async def test_stereoset_children_point_at_their_parent(session_factory):
+    """
+    Sentences and labels must follow their parents, including entries without children.
+    """
+    raw_entries = [
+        stereoset_entry("a", sentence_count=2, label_count=2),
+        stereoset_entry("empty", sentence_count=0, label_count=0),
+        stereoset_entry("b", sentence_count=1, label_count=0),
+        stereoset_entry("c", sentence_count=3, label_count=1),
+    ]
+    rows = [parse_stereoset_line(entry, "intersentence").unwrap() for entry in raw_entries]
+
+    # A batch with no sentences at all must not emit an empty child INSERT
+    empty_only = await insert_stereoset_batch_async(session_factory, rows[1:2]).awaitable()
+    assert empty_only == IOSuccess(1)
+
+    result = await insert_stereoset_batch_async(session_factory, rows[:1] + rows[2:]).awaitable()
+    assert result == IOSuccess(3)
+
+    async with session_factory() as session:
+        entries = (
+            await session.exec(
+                select(StereoSet).options(
+                    selectinload(StereoSet.sentences).selectinload(StereoSetSentence.labels)
+                )
+            )
+        ).all()
+
+    sentences_by_entry = {
+        entry.id: sorted(sentence.sentence_id for sentence in entry.sentences)
+        for entry in entries
+    }
+    assert sentences_by_entry == {
+        "a": ["a-s0", "a-s1"],
+        "empty": [],
+        "b": ["b-s0"],
+        "c": ["c-s0", "c-s1", "c-s2"],
+    }
+
+    for entry in entries:
+        for sentence in entry.sentences:
+            assert sentence.stereoset_id == entry.id
+            assert sentence.sentence.startswith(f"{entry.id} ")
+            for label in sentence.labels:
+                assert label.sentence_id == sentence.id
+                assert label.human_id.startswith(f"{sentence.sentence_id}-")
+
+    label_counts = {
+        sentence.sentence_id: len(sentence.labels)
+        for entry in entries
+        for sentence in entry.sentences
+    }
+    assert label_counts == {
+        "a-s0": 2,
+        "a-s1": 2,
+        "b-s0": 0,
+        "c-s0": 1,
+        "c-s1": 1,
+        "c-s2": 1,
+    }